@@ -10,16 +10,25 @@ Version: 1.0.0
 """
 
 import logging
-from typing import Dict, Any, Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from flask import Flask, jsonify, request, Response
-from flask_cors import CORS
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+import orjson
 import requests
-from pydantic import BaseModel, ValidationError
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -28,6 +37,30 @@ logger = logging.getLogger(__name__)
 BASE_URL = "http://localhost:7004/open-banking/products-services/v2"
 DEFAULT_PAGE = 1
 DEFAULT_PAGE_SIZE = 25
+MAX_PAGE = 1_000_000
+MAX_PAGE_SIZE = 100
+
+# OpenBanking product endpoints, keyed by the name used in this API's routes
+_ENDPOINTS = {
+    kind: f"/{kind}"
+    for kind in (
+        "personal-accounts",
+        "business-accounts",
+        "personal-loans",
+        "business-loans",
+        "personal-credit-cards",
+        "business-credit-cards",
+        "personal-financings",
+        "business-financings",
+        "personal-invoice-financings",
+        "business-invoice-financings",
+        "personal-unarranged-account-overdraft",
+        "business-unarranged-account-overdraft",
+    )
+}
+
+# Shared query for the default page; never mutated (requests only reads it)
+_DEFAULT_PARAMS = {"page": DEFAULT_PAGE, "page-size": DEFAULT_PAGE_SIZE}
 
 
 class OpenBankingConfig:
@@ -36,22 +69,99 @@ class OpenBankingConfig:
     def __init__(self, base_url: str = BASE_URL):
         self.base_url = base_url
         self.timeout = 30
+        self.debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+        self.cors_enabled = os.getenv('CORS_ENABLED', 'True').lower() == 'true'
+        self.pool_connections = 32
+        self.pool_maxsize = 128
+        self.max_workers = 16
+        self.max_retries = 2
+        self.cache_ttl = 60
+        self.cache_maxsize = 1024
+        # Sub-requests allowed in one batch call (one per product endpoint)
+        self.max_batch_size = len(_ENDPOINTS)
+        # Upstream bodies larger than this are relayed without buffering
+        # (and so skip the cache and compression); a full page of
+        # MAX_PAGE_SIZE records stays far below it
+        self.stream_min_bytes = 8 * 1024 * 1024
         self.default_headers = {
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+            # Only advertises encodings urllib3 can decode (br needs brotli)
+            'Accept-Encoding': ACCEPT_ENCODING
         }
 
 
-class PaginationParams(BaseModel):
-    """Pydantic model for pagination parameters validation."""
+@dataclass(frozen=True)
+class PaginationParams:
+    """Validated, immutable pagination parameters."""
     
     page: int = DEFAULT_PAGE
     page_size: int = DEFAULT_PAGE_SIZE
     
-    class Config:
-        """Pydantic configuration."""
-        validate_assignment = True
-        extra = "forbid"
+    def __post_init__(self) -> None:
+        page, page_size = _parse_pagination(self.page, self.page_size)
+        object.__setattr__(self, 'page', page)
+        object.__setattr__(self, 'page_size', page_size)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string."""
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response from orjson bytes, skipping the str round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj),
+            mimetype='application/json'
+        )
+
+
+def _pagination_query(page: int, page_size: int) -> Dict[str, int]:
+    """Build upstream query parameters, reusing the default-page dict."""
+    if page == DEFAULT_PAGE and page_size == DEFAULT_PAGE_SIZE:
+        return _DEFAULT_PARAMS
+    return {"page": page, "page-size": page_size}
+
+
+def _parse_pagination(page: Any, page_size: Any) -> Tuple[int, int]:
+    """
+    Convert and bounds-check pagination values.
+    
+    A plain int check is used on the request path instead of building a
+    ``PaginationParams`` model for every call.
+    
+    Args:
+        page: Raw page number
+        page_size: Raw number of records per page
+    
+    Returns:
+        Tuple of (page, page_size)
+    
+    Raises:
+        ValueError: If either value is not an integer or is out of range
+    """
+    try:
+        page = int(page)
+        page_size = int(page_size)
+    except (TypeError, ValueError) as exc:
+        logger.error("Invalid pagination parameters: %s", exc)
+        raise ValueError("Invalid pagination parameters")
+    
+    if not (1 <= page <= MAX_PAGE and 1 <= page_size <= MAX_PAGE_SIZE):
+        logger.error(
+            "Pagination out of range: page=%s, page_size=%s", page, page_size
+        )
+        raise ValueError("Invalid pagination parameters")
+    return page, page_size
 
 
 class OpenBankingClient:
@@ -61,6 +171,125 @@ class OpenBankingClient:
         self.config = config
         self.session = requests.Session()
         self.session.headers.update(config.default_headers)
+        
+        # Keep sockets to the upstream host alive and reuse them across
+        # requests; the default adapter only pools 10 connections per host.
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=Retry(
+                total=config.max_retries,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504]
+            ),
+            pool_block=False
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # One executor per process for concurrent fetches; never larger than
+        # the connection pool so workers don't queue for a socket
+        self.executor = ThreadPoolExecutor(
+            max_workers=min(config.max_workers, config.pool_maxsize),
+            thread_name_prefix='openbanking'
+        )
+        
+        # Full upstream URLs are built once instead of on every request
+        self._urls = {
+            path: f"{config.base_url}{path}" for path in _ENDPOINTS.values()
+        }
+        
+        # Fresh responses are served straight from memory; once they expire
+        # the ETag is kept so the next fetch can be a conditional request.
+        self._cache = TTLCache(maxsize=config.cache_maxsize, ttl=config.cache_ttl)
+        self._etags = LRUCache(maxsize=config.cache_maxsize)
+        self._cache_lock = threading.Lock()
+    
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection to the upstream host ahead of traffic.
+        
+        Failures are only logged; the mock API may not be up yet.
+        """
+        try:
+            self.session.get(f"{self.config.base_url}/health", timeout=2)
+        except requests.exceptions.RequestException as exc:
+            logger.warning("Upstream warm-up failed: %s", exc)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached upstream responses."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._etags.clear()
+    
+    def _make_request_raw(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Union[bytes, requests.Response], str]:
+        """
+        Make HTTP request to OpenBanking API and return the raw body.
+        
+        Responses are cached for ``config.cache_ttl`` seconds per endpoint
+        and query parameters. Expired entries carrying an ETag are
+        revalidated with ``If-None-Match`` so a 304 reuses the stored body.
+        
+        A body whose ``Content-Length`` exceeds ``config.stream_min_bytes``
+        is not read or cached; the open response is returned instead and
+        the caller must consume it and close it.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            
+        Returns:
+            Tuple of (response body or open response, upstream content type)
+            
+        Raises:
+            requests.RequestException: If request fails
+        """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            validator = self._etags.get(key) if cached is None else None
+        if cached is not None:
+            return cached
+        
+        url = self._urls.get(endpoint) or f"{self.config.base_url}{endpoint}"
+        headers = {'If-None-Match': validator[0]} if validator else None
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Making request to: %s with params: %s", url, params)
+        # Failures propagate to the app's RequestException handler, which logs
+        response = self.session.get(
+            url,
+            params=params,
+            headers=headers,
+            stream=True,
+            timeout=self.config.timeout
+        )
+        status_code = response.status_code
+        if status_code == 304 and validator:
+            response.close()
+            result = validator[1]
+        elif status_code >= 400:
+            response.close()
+            raise requests.HTTPError(f"{status_code} for {url}", response=response)
+        else:
+            content_type = response.headers.get('Content-Type', 'application/json')
+            content_length = response.headers.get('Content-Length', '')
+            if (content_length.isdigit()
+                    and int(content_length) > self.config.stream_min_bytes):
+                return response, content_type
+            result = (response.content, content_type)
+        
+        if 'no-store' not in response.headers.get('Cache-Control', ''):
+            etag = response.headers.get('ETag')
+            with self._cache_lock:
+                self._cache[key] = result
+                if etag:
+                    self._etags[key] = (etag, result)
+        return result
     
     def _make_request(
         self, 
@@ -73,28 +302,99 @@ class OpenBankingClient:
         Args:
             endpoint: API endpoint path
             params: Query parameters
-            
+        
         Returns:
             JSON response data
-            
+        
         Raises:
             requests.RequestException: If request fails
         """
-        url = f"{self.config.base_url}{endpoint}"
-        
+        content, _ = self._make_request_raw(endpoint, params)
+        if isinstance(content, requests.Response):
+            content = content.content
         try:
-            logger.info(f"Making request to: {url} with params: {params}")
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.config.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as exc:
+            logger.error("Invalid JSON from %s: %s", endpoint, exc)
+            raise requests.exceptions.InvalidJSONError(str(exc))
+    
+    def get(
+        self,
+        kind: str,
+        page: int = DEFAULT_PAGE,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Get data for any OpenBanking product endpoint.
+        
+        Args:
+            kind: Endpoint name, e.g. ``"personal-accounts"``
+            page: Page number
+            page_size: Number of records per page
+        
+        Returns:
+            JSON response data
+        
+        Raises:
+            KeyError: If ``kind`` is not a known endpoint
+            requests.RequestException: If request fails
+        """
+        params = _pagination_query(page, page_size)
+        return self._make_request(_ENDPOINTS[kind], params)
+    
+    def get_raw(
+        self,
+        kind: str,
+        page: int = DEFAULT_PAGE,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[Union[bytes, requests.Response], str]:
+        """
+        Get the unparsed upstream body for any OpenBanking product endpoint.
+        
+        Use this when the payload is forwarded as-is, to skip parsing it
+        into Python objects and serializing it back.
+        
+        Args:
+            kind: Endpoint name, e.g. ``"personal-accounts"``
+            page: Page number
+            page_size: Number of records per page
+        
+        Returns:
+            Tuple of (response body, upstream content type); oversized
+            bodies come back as an open response the caller must close
+        
+        Raises:
+            KeyError: If ``kind`` is not a known endpoint
+            requests.RequestException: If request fails
+        """
+        params = _pagination_query(page, page_size)
+        return self._make_request_raw(_ENDPOINTS[kind], params)
+    
+    def fetch_many(
+        self,
+        specs: Sequence[Tuple[str, int, int]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch several endpoints concurrently.
+        
+        The upstream calls are pure network I/O, so running them on the
+        client's shared thread pool overlaps the round trips instead of
+        paying them one after another.
+        
+        Args:
+            specs: Sequence of (kind, page, page_size) tuples
             
-        except requests.exceptions.RequestException as exc:
-            logger.error(f"Request failed for {url}: {str(exc)}")
-            raise
+        Returns:
+            JSON responses in the same order as ``specs``
+            
+        Raises:
+            requests.RequestException: If any request fails
+        """
+        futures = [
+            self.executor.submit(self.get, kind, page, page_size)
+            for kind, page, page_size in specs
+        ]
+        return [future.result() for future in futures]
     
     def get_personal_accounts(
         self, 
@@ -102,8 +402,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get personal accounts data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/personal-accounts", params)
+        return self.get("personal-accounts", page, page_size)
     
     def get_business_accounts(
         self, 
@@ -111,8 +410,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get business accounts data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/business-accounts", params)
+        return self.get("business-accounts", page, page_size)
     
     def get_personal_loans(
         self, 
@@ -120,8 +418,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get personal loans data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/personal-loans", params)
+        return self.get("personal-loans", page, page_size)
     
     def get_business_loans(
         self, 
@@ -129,8 +426,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get business loans data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/business-loans", params)
+        return self.get("business-loans", page, page_size)
     
     def get_personal_credit_cards(
         self, 
@@ -138,8 +434,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get personal credit cards data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/personal-credit-cards", params)
+        return self.get("personal-credit-cards", page, page_size)
     
     def get_business_credit_cards(
         self, 
@@ -147,8 +442,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get business credit cards data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/business-credit-cards", params)
+        return self.get("business-credit-cards", page, page_size)
     
     def get_personal_financings(
         self, 
@@ -156,8 +450,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get personal financings data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/personal-financings", params)
+        return self.get("personal-financings", page, page_size)
     
     def get_business_financings(
         self, 
@@ -165,8 +458,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get business financings data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/business-financings", params)
+        return self.get("business-financings", page, page_size)
     
     def get_personal_invoice_financings(
         self, 
@@ -174,8 +466,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get personal invoice financings data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/personal-invoice-financings", params)
+        return self.get("personal-invoice-financings", page, page_size)
     
     def get_business_invoice_financings(
         self, 
@@ -183,8 +474,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get business invoice financings data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/business-invoice-financings", params)
+        return self.get("business-invoice-financings", page, page_size)
     
     def get_personal_unarranged_account_overdraft(
         self, 
@@ -192,8 +482,7 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get personal unarranged account overdraft data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/personal-unarranged-account-overdraft", params)
+        return self.get("personal-unarranged-account-overdraft", page, page_size)
     
     def get_business_unarranged_account_overdraft(
         self, 
@@ -201,241 +490,200 @@ class OpenBankingClient:
         page_size: int = DEFAULT_PAGE_SIZE
     ) -> Dict[str, Any]:
         """Get business unarranged account overdraft data."""
-        params = {"page": page, "page-size": page_size}
-        return self._make_request("/business-unarranged-account-overdraft", params)
+        return self.get("business-unarranged-account-overdraft", page, page_size)
+
+
+_client: Optional[OpenBankingClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OpenBankingClient:
+    """
+    Get the process-wide OpenBankingClient, creating it on first use.
+    
+    Sharing one client keeps a single connection pool and response cache
+    per process, however many times ``create_app`` is called.
+    
+    Returns:
+        Shared OpenBankingClient instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = OpenBankingClient(OpenBankingConfig())
+                client.warm_up()
+                _client = client
+    return _client
 
 
 def create_app() -> Flask:
     """Create and configure Flask application."""
     app = Flask(__name__)
-    CORS(app)
+    app.json = OrjsonProvider(app)
     
     # Initialize OpenBanking client
-    config = OpenBankingConfig()
-    client = OpenBankingClient(config)
-    
-    def _validate_pagination_params() -> PaginationParams:
-        """Validate and extract pagination parameters from request."""
-        try:
-            page = int(request.args.get('page', DEFAULT_PAGE))
-            page_size = int(request.args.get('page-size', DEFAULT_PAGE_SIZE))
-            return PaginationParams(page=page, page_size=page_size)
-        except (ValueError, ValidationError) as exc:
-            logger.error(f"Invalid pagination parameters: {str(exc)}")
-            raise ValueError("Invalid pagination parameters")
-    
-    def _handle_api_error(func):
-        """Decorator to handle API errors consistently."""
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except ValueError as exc:
-                return jsonify({"error": str(exc)}), 400
-            except requests.exceptions.RequestException as exc:
-                logger.error(f"API request failed: {str(exc)}")
-                return jsonify({"error": "External API request failed"}), 502
-            except Exception as exc:
-                logger.error(f"Unexpected error: {str(exc)}")
-                return jsonify({"error": "Internal server error"}), 500
-        
-        wrapper.__name__ = func.__name__
-        return wrapper
-    
-    @app.route('/health', methods=['GET'])
-    def health_check() -> Response:
-        """Health check endpoint."""
-        return jsonify({
-            "status": "healthy",
-            "service": "openbanking-api-client",
-            "version": "1.0.0"
-        })
-    
-    @app.route('/api/v1/personal-accounts', methods=['GET'])
-    @_handle_api_error
-    def get_personal_accounts() -> Response:
-        """Get personal accounts data."""
-        params = _validate_pagination_params()
-        data = client.get_personal_accounts(params.page, params.page_size)
-        return jsonify(data)
-    
-    @app.route('/api/v1/business-accounts', methods=['GET'])
-    @_handle_api_error
-    def get_business_accounts() -> Response:
-        """Get business accounts data."""
-        params = _validate_pagination_params()
-        data = client.get_business_accounts(params.page, params.page_size)
-        return jsonify(data)
+    client = get_client()
+    config = client.config
     
-    @app.route('/api/v1/personal-loans', methods=['GET'])
-    @_handle_api_error
-    def get_personal_loans() -> Response:
-        """Get personal loans data."""
-        params = _validate_pagination_params()
-        data = client.get_personal_loans(params.page, params.page_size)
-        return jsonify(data)
+    if config.cors_enabled:
+        from flask_cors import CORS
+        CORS(app)
     
-    @app.route('/api/v1/business-loans', methods=['GET'])
-    @_handle_api_error
-    def get_business_loans() -> Response:
-        """Get business loans data."""
-        params = _validate_pagination_params()
-        data = client.get_business_loans(params.page, params.page_size)
-        return jsonify(data)
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 5
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    # Compressing a stream means buffering it, which defeats streaming
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
     
-    @app.route('/api/v1/personal-credit-cards', methods=['GET'])
-    @_handle_api_error
-    def get_personal_credit_cards() -> Response:
-        """Get personal credit cards data."""
-        params = _validate_pagination_params()
-        data = client.get_personal_credit_cards(params.page, params.page_size)
-        return jsonify(data)
+    app.extensions['openbanking_executor'] = client.executor
     
-    @app.route('/api/v1/business-credit-cards', methods=['GET'])
-    @_handle_api_error
-    def get_business_credit_cards() -> Response:
-        """Get business credit cards data."""
-        params = _validate_pagination_params()
-        data = client.get_business_credit_cards(params.page, params.page_size)
-        return jsonify(data)
-    
-    @app.route('/api/v1/personal-financings', methods=['GET'])
-    @_handle_api_error
-    def get_personal_financings() -> Response:
-        """Get personal financings data."""
-        params = _validate_pagination_params()
-        data = client.get_personal_financings(params.page, params.page_size)
-        return jsonify(data)
+    def _validate_pagination_params() -> Tuple[int, int]:
+        """Validate and extract pagination parameters from request."""
+        page = request.args.get('page')
+        page_size = request.args.get('page-size')
+        return _parse_pagination(
+            page if page else DEFAULT_PAGE,
+            page_size if page_size else DEFAULT_PAGE_SIZE
+        )
     
-    @app.route('/api/v1/business-financings', methods=['GET'])
-    @_handle_api_error
-    def get_business_financings() -> Response:
-        """Get business financings data."""
-        params = _validate_pagination_params()
-        data = client.get_business_financings(params.page, params.page_size)
-        return jsonify(data)
+    def _validate_batch_requests() -> List[Tuple[str, int, int]]:
+        """Validate and extract sub-requests from a batch request body."""
+        body = request.get_json(silent=True)
+        if not isinstance(body, dict) or not isinstance(body.get('requests'), list):
+            raise ValueError("Request body must contain a 'requests' list")
+        if len(body['requests']) > config.max_batch_size:
+            raise ValueError(
+                f"Batch may contain at most {config.max_batch_size} requests"
+            )
+        
+        batch = []
+        for item in body['requests']:
+            if (not isinstance(item, dict)
+                    or not isinstance(item.get('endpoint'), str)
+                    or item['endpoint'] not in _ENDPOINTS):
+                raise ValueError(f"Invalid batch request: {item}")
+            # JSON pagination values must be real integers; int() would
+            # silently accept true or 2.9
+            for key in ('page', 'page_size'):
+                if key in item and (not isinstance(item[key], int)
+                                    or isinstance(item[key], bool)):
+                    raise ValueError("Invalid pagination parameters")
+            page, page_size = _parse_pagination(
+                item.get('page', DEFAULT_PAGE),
+                item.get('page_size', DEFAULT_PAGE_SIZE)
+            )
+            batch.append((item['endpoint'], page, page_size))
+        return batch
+    
+    def _batch_result(future) -> Dict[str, Any]:
+        """Convert a finished batch future into a result entry."""
+        exc = future.exception()
+        if exc is None:
+            return {"status": "ok", "data": future.result()}
+        if isinstance(exc, requests.exceptions.RequestException):
+            logger.error("API request failed: %s", exc)
+            return {"status": "error", "message": "External API request failed"}
+        logger.error("Unexpected error: %s", exc)
+        return {"status": "error", "message": "Internal server error"}
+    
+    # Static payloads are serialized once instead of on every request
+    health_json = orjson.dumps({
+        "status": "healthy",
+        "service": "openbanking-api-client",
+        "version": "1.0.0"
+    })
+    
+    endpoints = [
+        {
+            "path": f"/api/v1/{kind}",
+            "method": "GET",
+            "description": f"Get {kind.replace('-', ' ')} data",
+            "parameters": ["page", "page-size"]
+        }
+        for kind in _ENDPOINTS
+    ] + [
+        {
+            "path": "/api/v1/batch",
+            "method": "POST",
+            "description": "Fetch several endpoints concurrently",
+            "parameters": ["requests"]
+        },
+        {
+            "path": "/api/v1/cache/clear",
+            "method": "POST",
+            "description": "Clear cached upstream responses",
+            "parameters": []
+        }
+    ]
     
-    @app.route('/api/v1/personal-invoice-financings', methods=['GET'])
-    @_handle_api_error
-    def get_personal_invoice_financings() -> Response:
-        """Get personal invoice financings data."""
-        params = _validate_pagination_params()
-        data = client.get_personal_invoice_financings(params.page, params.page_size)
-        return jsonify(data)
+    endpoints_json = orjson.dumps({
+        "service": "OpenBanking API Client",
+        "version": "1.0.0",
+        "base_url": config.base_url,
+        "endpoints": endpoints
+    })
     
-    @app.route('/api/v1/business-invoice-financings', methods=['GET'])
-    @_handle_api_error
-    def get_business_invoice_financings() -> Response:
-        """Get business invoice financings data."""
-        params = _validate_pagination_params()
-        data = client.get_business_invoice_financings(params.page, params.page_size)
-        return jsonify(data)
-    
-    @app.route('/api/v1/personal-unarranged-account-overdraft', methods=['GET'])
-    @_handle_api_error
-    def get_personal_unarranged_account_overdraft() -> Response:
-        """Get personal unarranged account overdraft data."""
-        params = _validate_pagination_params()
-        data = client.get_personal_unarranged_account_overdraft(
-            params.page, 
-            params.page_size
+    @app.route('/health', methods=['GET'])
+    def health_check() -> Response:
+        """Health check endpoint."""
+        return Response(health_json, mimetype='application/json')
+    
+    def get_product(kind: str) -> Response:
+        """Get data for an OpenBanking product endpoint."""
+        page, page_size = _validate_pagination_params()
+        body, content_type = client.get_raw(kind, page, page_size)
+        if isinstance(body, requests.Response):
+            # Oversized upstream bodies are relayed without buffering
+            upstream = body
+            headers = {}
+            # iter_content decodes gzip/br, so a compressed length would lie
+            if 'Content-Encoding' not in upstream.headers:
+                content_length = upstream.headers.get('Content-Length')
+                if content_length:
+                    headers['Content-Length'] = content_length
+            response = Response(
+                upstream.iter_content(chunk_size=65536),
+                content_type=content_type,
+                headers=headers
+            )
+            # Runs even if the body is never iterated (HEAD, early disconnect)
+            response.call_on_close(upstream.close)
+            return response
+        
+        return Response(body, content_type=content_type)
+    
+    # One shared view serves every product endpoint
+    for kind in _ENDPOINTS:
+        app.add_url_rule(
+            f"/api/v1/{kind}",
+            endpoint=f"get_{kind.replace('-', '_')}",
+            view_func=get_product,
+            methods=['GET'],
+            defaults={"kind": kind}
         )
-        return jsonify(data)
     
-    @app.route('/api/v1/business-unarranged-account-overdraft', methods=['GET'])
-    @_handle_api_error
-    def get_business_unarranged_account_overdraft() -> Response:
-        """Get business unarranged account overdraft data."""
-        params = _validate_pagination_params()
-        data = client.get_business_unarranged_account_overdraft(
-            params.page, 
-            params.page_size
-        )
-        return jsonify(data)
+    @app.route('/api/v1/batch', methods=['POST'])
+    def batch() -> Response:
+        """Fetch several endpoints concurrently in a single call."""
+        executor = app.extensions['openbanking_executor']
+        futures = [
+            executor.submit(client.get, endpoint, page, page_size)
+            for endpoint, page, page_size in _validate_batch_requests()
+        ]
+        return jsonify([_batch_result(future) for future in futures])
+    
+    @app.route('/api/v1/cache/clear', methods=['POST'])
+    def clear_cache() -> Response:
+        """Clear cached upstream responses."""
+        client.clear_cache()
+        return jsonify({"status": "cleared"})
     
     @app.route('/api/v1/endpoints', methods=['GET'])
     def list_available_endpoints() -> Response:
         """List all available API endpoints."""
-        endpoints = [
-            {
-                "path": "/api/v1/personal-accounts",
-                "method": "GET",
-                "description": "Get personal accounts data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/business-accounts", 
-                "method": "GET",
-                "description": "Get business accounts data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/personal-loans",
-                "method": "GET", 
-                "description": "Get personal loans data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/business-loans",
-                "method": "GET",
-                "description": "Get business loans data", 
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/personal-credit-cards",
-                "method": "GET",
-                "description": "Get personal credit cards data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/business-credit-cards",
-                "method": "GET",
-                "description": "Get business credit cards data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/personal-financings",
-                "method": "GET",
-                "description": "Get personal financings data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/business-financings",
-                "method": "GET",
-                "description": "Get business financings data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/personal-invoice-financings",
-                "method": "GET",
-                "description": "Get personal invoice financings data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/business-invoice-financings",
-                "method": "GET",
-                "description": "Get business invoice financings data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/personal-unarranged-account-overdraft",
-                "method": "GET",
-                "description": "Get personal unarranged account overdraft data",
-                "parameters": ["page", "page-size"]
-            },
-            {
-                "path": "/api/v1/business-unarranged-account-overdraft",
-                "method": "GET",
-                "description": "Get business unarranged account overdraft data",
-                "parameters": ["page", "page-size"]
-            }
-        ]
-        
-        return jsonify({
-            "service": "OpenBanking API Client",
-            "version": "1.0.0",
-            "base_url": config.base_url,
-            "endpoints": endpoints
-        })
+        return Response(endpoints_json, mimetype='application/json')
     
     @app.errorhandler(404)
     def not_found(error) -> Response:
@@ -445,9 +693,21 @@ def create_app() -> Flask:
             "message": "The requested endpoint does not exist"
         }), 404
     
+    @app.errorhandler(ValueError)
+    def bad_request(error) -> Response:
+        """Handle invalid request parameters."""
+        return jsonify({"error": str(error)}), 400
+    
+    @app.errorhandler(requests.exceptions.RequestException)
+    def upstream_error(error) -> Response:
+        """Handle failed requests to the OpenBanking API."""
+        logger.error("API request failed: %s", error)
+        return jsonify({"error": "External API request failed"}), 502
+    
     @app.errorhandler(500)
     def internal_error(error) -> Response:
         """Handle 500 errors."""
+        logger.error("Unexpected error: %s", error.original_exception or error)
         return jsonify({
             "error": "Internal server error",
             "message": "An unexpected error occurred"
@@ -459,4 +719,4 @@ def create_app() -> Flask:
 if __name__ == '__main__':
     app = create_app()
     logger.info("Starting OpenBanking API Client")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=OpenBankingConfig().debug)
@@ -5,11 +5,22 @@ This module contains comprehensive tests for the Flask API that interacts
 with OpenBanking Brasil mock API endpoints.
 """
 
+import dataclasses
+import gzip
+import os
+import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import Mock, patch, MagicMock
 import json
 import requests
-from app import create_app, OpenBankingClient, OpenBankingConfig, PaginationParams
+from app import (
+    create_app, get_client, OpenBankingClient, OpenBankingConfig, OrjsonProvider,
+    PaginationParams
+)
+import test_connection
+from test_connection import APITester
 
 
 class TestOpenBankingConfig(unittest.TestCase):
@@ -27,10 +38,17 @@ class TestOpenBankingConfig(unittest.TestCase):
         custom_url = "http://custom.example.com/api"
         config = OpenBankingConfig(custom_url)
         self.assertEqual(config.base_url, custom_url)
+    
+    def test_config_debug_from_environment(self):
+        """Test debug mode is off unless FLASK_DEBUG is set."""
+        with patch.dict('os.environ', {}, clear=True):
+            self.assertFalse(OpenBankingConfig().debug)
+        with patch.dict('os.environ', {'FLASK_DEBUG': 'True'}):
+            self.assertTrue(OpenBankingConfig().debug)
 
 
 class TestPaginationParams(unittest.TestCase):
-    """Test cases for PaginationParams Pydantic model."""
+    """Test cases for PaginationParams dataclass."""
     
     def test_valid_pagination_params(self):
         """Test valid pagination parameters."""
@@ -43,6 +61,19 @@ class TestPaginationParams(unittest.TestCase):
         params = PaginationParams()
         self.assertEqual(params.page, 1)
         self.assertEqual(params.page_size, 25)
+    
+    def test_pagination_params_frozen(self):
+        """Test pagination parameters cannot be reassigned."""
+        params = PaginationParams()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            params.page = 2
+    
+    def test_invalid_pagination_params(self):
+        """Test out-of-range pagination parameters are rejected."""
+        with self.assertRaises(ValueError):
+            PaginationParams(page=0)
+        with self.assertRaises(TypeError):
+            PaginationParams(page=1, extra=True)
 
 
 class TestOpenBankingClient(unittest.TestCase):
@@ -53,6 +84,18 @@ class TestOpenBankingClient(unittest.TestCase):
         self.config = OpenBankingConfig()
         self.client = OpenBankingClient(self.config)
     
+    def test_session_connection_pool(self):
+        """Test session mounts a pooled adapter with retries."""
+        adapter = self.client.session.get_adapter(self.config.base_url)
+        
+        self.assertEqual(adapter._pool_maxsize, self.config.pool_maxsize)
+        self.assertEqual(adapter.max_retries.total, self.config.max_retries)
+        self.assertEqual(self.client.session.headers['Connection'], 'keep-alive')
+        self.assertLessEqual(
+            self.client.executor._max_workers,
+            self.config.pool_maxsize
+        )
+    
     @patch.object(OpenBankingClient, '_make_request')
     def test_get_personal_accounts(self, mock_make_request):
         """Test get_personal_accounts method."""
@@ -108,6 +151,148 @@ class TestOpenBankingClient(unittest.TestCase):
                     {"page": 1, "page-size": 25}
                 )
                 self.assertEqual(result, {"data": "test"})
+    
+    @patch.object(OpenBankingClient, '_make_request')
+    def test_get_dispatches_by_kind(self, mock_make_request):
+        """Test generic get method maps endpoint names to paths."""
+        mock_make_request.return_value = {"data": "test"}
+        
+        self.client.get("personal-credit-cards", 3, 5)
+        
+        mock_make_request.assert_called_once_with(
+            "/personal-credit-cards",
+            {"page": 3, "page-size": 5}
+        )
+        with self.assertRaises(KeyError):
+            self.client.get("nonexistent")
+    
+    @patch.object(OpenBankingClient, '_make_request')
+    def test_default_page_reuses_params(self, mock_make_request):
+        """Test the default page shares one query dict across calls."""
+        self.client.get("personal-loans")
+        self.client.get("business-loans")
+        
+        first, second = (call.args[1] for call in mock_make_request.call_args_list)
+        self.assertIs(first, second)
+    
+    @patch.object(OpenBankingClient, '_make_request')
+    def test_fetch_many_preserves_order(self, mock_make_request):
+        """Test fetch_many returns results in submission order."""
+        mock_make_request.side_effect = lambda endpoint, params: {
+            "endpoint": endpoint,
+            "params": params
+        }
+        
+        results = self.client.fetch_many([
+            ("personal-accounts", 1, 25),
+            ("business-loans", 2, 10)
+        ])
+        
+        self.assertEqual(results, [
+            {"endpoint": "/personal-accounts", "params": {"page": 1, "page-size": 25}},
+            {"endpoint": "/business-loans", "params": {"page": 2, "page-size": 10}}
+        ])
+        self.assertEqual(self.client.fetch_many([]), [])
+
+    @patch.object(requests.Session, 'get')
+    def test_make_request_caches_response(self, mock_get):
+        """Test identical requests within the TTL hit upstream once."""
+        mock_get.return_value = Mock(
+            status_code=200,
+            headers={},
+            content=b'{"data": "cached"}'
+        )
+        
+        first = self.client._make_request("/personal-accounts", {"page": 1})
+        second = self.client._make_request("/personal-accounts", {"page": 1})
+        
+        self.assertEqual(first, {"data": "cached"})
+        self.assertEqual(second, {"data": "cached"})
+        mock_get.assert_called_once()
+        
+        self.client.clear_cache()
+        self.client._make_request("/personal-accounts", {"page": 1})
+        self.assertEqual(mock_get.call_count, 2)
+    
+    @patch.object(requests.Session, 'get')
+    def test_make_request_http_error(self, mock_get):
+        """Test upstream error statuses raise HTTPError and are not cached."""
+        mock_get.return_value = Mock(status_code=404, headers={}, content=b'')
+        
+        with self.assertRaises(requests.exceptions.HTTPError) as ctx:
+            self.client._make_request("/personal-accounts")
+        
+        self.assertIn("404", str(ctx.exception))
+        self.assertEqual(len(self.client._cache), 0)
+    
+    @patch.object(requests.Session, 'get')
+    def test_make_request_invalid_json(self, mock_get):
+        """Test malformed upstream JSON surfaces as a request error."""
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b'<html>')
+        
+        with self.assertRaises(requests.exceptions.RequestException):
+            self.client._make_request("/personal-accounts")
+    
+    @patch.object(requests.Session, 'get')
+    def test_make_request_raw_closes_failed_response(self, mock_get):
+        """Test failed requests release their connection."""
+        failed = Mock(status_code=503)
+        mock_get.return_value = failed
+        
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.get_raw("personal-accounts", 1, 100)
+        
+        failed.close.assert_called_once()
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+    
+    @patch.object(requests.Session, 'get')
+    def test_make_request_raw_oversized_body_not_buffered(self, mock_get):
+        """Test bodies above stream_min_bytes come back open and uncached."""
+        size = str(self.config.stream_min_bytes + 1)
+        upstream = Mock(status_code=200, headers={'Content-Length': size})
+        mock_get.return_value = upstream
+        
+        body, _ = self.client.get_raw("personal-accounts", 1, 100)
+        
+        self.assertIs(body, upstream)
+        self.assertEqual(len(self.client._cache), 0)
+        upstream.close.assert_not_called()
+    
+    @patch.object(requests.Session, 'get')
+    def test_make_request_raw_full_page_is_cached(self, mock_get):
+        """Test a full page below stream_min_bytes is buffered and cached."""
+        mock_get.return_value = Mock(
+            status_code=200,
+            headers={'Content-Length': '18'},
+            content=b'{"data": "cached"}'
+        )
+        
+        first = self.client.get_raw("personal-accounts", 1, 100)
+        second = self.client.get_raw("personal-accounts", 1, 100)
+        
+        self.assertEqual(first, (b'{"data": "cached"}', 'application/json'))
+        self.assertEqual(second, first)
+        mock_get.assert_called_once()
+    
+    @patch.object(requests.Session, 'get')
+    def test_make_request_revalidates_with_etag(self, mock_get):
+        """Test expired entries are revalidated with If-None-Match."""
+        fresh = Mock(
+            status_code=200,
+            headers={'ETag': '"v1"'},
+            content=b'{"data": "v1"}'
+        )
+        mock_get.side_effect = [fresh, Mock(status_code=304, headers={})]
+        
+        self.client._make_request("/personal-loans")
+        self.client._cache.clear()
+        result = self.client._make_request("/personal-loans")
+        
+        self.assertEqual(result, {"data": "v1"})
+        self.assertEqual(
+            mock_get.call_args.kwargs['headers'],
+            {'If-None-Match': '"v1"'}
+        )
 
 
 class TestFlaskAPI(unittest.TestCase):
@@ -119,6 +304,34 @@ class TestFlaskAPI(unittest.TestCase):
         self.app.config['TESTING'] = True
         self.client = self.app.test_client()
     
+    def test_client_shared_across_apps(self):
+        """Test apps reuse the process-wide OpenBanking client."""
+        self.assertIs(get_client(), get_client())
+        
+        with patch.object(get_client(), 'get_raw') as mock_get_raw:
+            mock_get_raw.return_value = (b'{}', 'application/json')
+            create_app().test_client().get('/api/v1/personal-loans')
+            self.client.get('/api/v1/personal-loans')
+        
+        self.assertEqual(mock_get_raw.call_count, 2)
+    
+    def test_executor_shared_with_client(self):
+        """Test the app reuses the client's fan-out executor."""
+        self.assertIs(
+            self.app.extensions['openbanking_executor'],
+            get_client().executor
+        )
+    
+    def test_orjson_json_provider(self):
+        """Test the app serializes and parses JSON with orjson."""
+        self.assertIsInstance(self.app.json, OrjsonProvider)
+        
+        with self.app.app_context():
+            response = self.app.json.response({"page": 1, "name": "ç"})
+        self.assertEqual(json.loads(response.data), {"page": 1, "name": "ç"})
+        self.assertEqual(self.app.json.loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(json.loads(self.app.json.dumps({"a": None})), {"a": None})
+    
     def test_health_check(self):
         """Test health check endpoint."""
         response = self.client.get('/health')
@@ -138,6 +351,32 @@ class TestFlaskAPI(unittest.TestCase):
         self.assertIsInstance(data['endpoints'], list)
         self.assertTrue(len(data['endpoints']) > 0)
     
+    def test_response_compression(self):
+        """Test JSON responses are compressed when the client accepts it."""
+        response = self.client.get(
+            '/api/v1/endpoints',
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        
+        data = json.loads(gzip.decompress(response.data))
+        self.assertIn('endpoints', data)
+    
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_full_page_is_compressed(self, mock_make_request_raw):
+        """Test a MAX_PAGE_SIZE page stays on the buffered, compressed path."""
+        body = json.dumps({"data": ["record"] * 500}).encode()
+        mock_make_request_raw.return_value = (body, 'application/json')
+        
+        response = self.client.get(
+            '/api/v1/personal-accounts?page-size=100',
+            headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.data), body)
+    
     def test_not_found_endpoint(self):
         """Test 404 error handling."""
         response = self.client.get('/nonexistent')
@@ -146,32 +385,89 @@ class TestFlaskAPI(unittest.TestCase):
         data = json.loads(response.data)
         self.assertIn('error', data)
     
-    @patch('app.OpenBankingClient.get_personal_accounts')
-    def test_personal_accounts_endpoint(self, mock_get_personal_accounts):
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_personal_accounts_endpoint(self, mock_make_request_raw):
         """Test personal accounts endpoint."""
-        mock_get_personal_accounts.return_value = {"data": "personal_accounts"}
+        mock_make_request_raw.return_value = (
+            b'{"data": "personal_accounts"}',
+            'application/json'
+        )
         
         response = self.client.get('/api/v1/personal-accounts')
         self.assertEqual(response.status_code, 200)
         
         data = json.loads(response.data)
         self.assertEqual(data, {"data": "personal_accounts"})
-        mock_get_personal_accounts.assert_called_once()
+        self.assertEqual(response.mimetype, 'application/json')
+        mock_make_request_raw.assert_called_once()
     
-    @patch('app.OpenBankingClient.get_personal_accounts')
-    def test_personal_accounts_with_pagination(self, mock_get_personal_accounts):
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_personal_accounts_with_pagination(self, mock_make_request_raw):
         """Test personal accounts endpoint with pagination."""
-        mock_get_personal_accounts.return_value = {"data": "personal_accounts"}
+        mock_make_request_raw.return_value = (
+            b'{"data": "personal_accounts"}',
+            'application/json'
+        )
+        
+        response = self.client.get('/api/v1/personal-accounts?page=2&page-size=50')
+        self.assertEqual(response.status_code, 200)
+        
+        mock_make_request_raw.assert_called_once_with(
+            "/personal-accounts",
+            {"page": 2, "page-size": 50}
+        )
+    
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_large_body_is_streamed(self, mock_make_request_raw):
+        """Test oversized upstream bodies are streamed straight through."""
+        upstream = Mock(spec=requests.Response, headers={'Content-Length': '20'})
+        upstream.iter_content.return_value = iter([b'{"data": ', b'"streamed"}'])
+        mock_make_request_raw.return_value = (upstream, 'application/json')
         
         response = self.client.get('/api/v1/personal-accounts?page=2&page-size=50')
         self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.headers['Content-Length'], '20')
         
-        mock_get_personal_accounts.assert_called_once_with(2, 50)
+        data = json.loads(response.data)
+        self.assertEqual(data, {"data": "streamed"})
+        mock_make_request_raw.assert_called_once_with(
+            "/personal-accounts",
+            {"page": 2, "page-size": 50}
+        )
+        response.close()
+        upstream.close.assert_called_once()
     
-    @patch('app.OpenBankingClient.get_business_accounts')
-    def test_business_accounts_endpoint(self, mock_get_business_accounts):
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_large_body_head_closes_upstream(self, mock_make_request_raw):
+        """Test a streamed response releases upstream even when never read."""
+        upstream = Mock(spec=requests.Response, headers={})
+        upstream.iter_content.return_value = iter([b'{}'])
+        mock_make_request_raw.return_value = (upstream, 'application/json')
+        
+        response = self.client.head('/api/v1/personal-accounts?page-size=60')
+        self.assertEqual(response.status_code, 200)
+        response.close()
+        
+        upstream.close.assert_called_once()
+    
+    def test_invalid_pagination(self):
+        """Test invalid or out-of-range pagination is rejected."""
+        for query in ['page=abc', 'page=0', 'page-size=0', 'page-size=101']:
+            with self.subTest(query=query):
+                response = self.client.get(f'/api/v1/personal-accounts?{query}')
+                self.assertEqual(response.status_code, 400)
+                
+                data = json.loads(response.data)
+                self.assertEqual(data['error'], 'Invalid pagination parameters')
+    
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_business_accounts_endpoint(self, mock_make_request_raw):
         """Test business accounts endpoint."""
-        mock_get_business_accounts.return_value = {"data": "business_accounts"}
+        mock_make_request_raw.return_value = (
+            b'{"data": "business_accounts"}',
+            'application/json'
+        )
         
         response = self.client.get('/api/v1/business-accounts')
         self.assertEqual(response.status_code, 200)
@@ -180,9 +476,66 @@ class TestFlaskAPI(unittest.TestCase):
         self.assertEqual(data, {"data": "business_accounts"})
     
     @patch('app.OpenBankingClient._make_request')
-    def test_api_error_handling(self, mock_make_request):
+    def test_batch_endpoint(self, mock_make_request):
+        """Test batch endpoint returns results in request order."""
+        def fake_request(endpoint, params):
+            if endpoint == "/business-loans":
+                raise requests.exceptions.RequestException("API Error")
+            return {"endpoint": endpoint, "params": params}
+        mock_make_request.side_effect = fake_request
+        
+        response = self.client.post('/api/v1/batch', json={"requests": [
+            {"endpoint": "personal-accounts", "page": 2, "page_size": 10},
+            {"endpoint": "business-loans"}
+        ]})
+        self.assertEqual(response.status_code, 200)
+        
+        data = json.loads(response.data)
+        self.assertEqual(data[0], {
+            "status": "ok",
+            "data": {
+                "endpoint": "/personal-accounts",
+                "params": {"page": 2, "page-size": 10}
+            }
+        })
+        self.assertEqual(data[1], {
+            "status": "error",
+            "message": "External API request failed"
+        })
+    
+    def test_batch_endpoint_invalid_body(self):
+        """Test batch endpoint rejects malformed requests."""
+        for body in [{}, {"requests": [{"endpoint": "nonexistent"}]},
+                     {"requests": [{"endpoint": ["personal-loans"]}]},
+                     {"requests": [{"endpoint": "personal-loans", "page": "x"}]},
+                     {"requests": [{"endpoint": "personal-loans", "page": True}]},
+                     {"requests": [{"endpoint": "personal-loans", "page_size": 2.9}]}]:
+            with self.subTest(body=body):
+                response = self.client.post('/api/v1/batch', json=body)
+                self.assertEqual(response.status_code, 400)
+    
+    @patch('app.OpenBankingClient._make_request')
+    def test_batch_endpoint_size_limit(self, mock_make_request):
+        """Test batch endpoint rejects more sub-requests than the limit."""
+        limit = OpenBankingConfig().max_batch_size
+        response = self.client.post('/api/v1/batch', json={
+            "requests": [{"endpoint": "personal-loans"}] * (limit + 1)
+        })
+        self.assertEqual(response.status_code, 400)
+        mock_make_request.assert_not_called()
+    
+    def test_clear_cache_endpoint(self):
+        """Test cache clear endpoint."""
+        response = self.client.post('/api/v1/cache/clear')
+        self.assertEqual(response.status_code, 200)
+        
+        data = json.loads(response.data)
+        self.assertEqual(data['status'], 'cleared')
+    
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_api_error_handling(self, mock_make_request_raw):
         """Test API error handling."""
-        mock_make_request.side_effect = requests.exceptions.RequestException("API Error")
+        mock_make_request_raw.side_effect = requests.exceptions.RequestException("API Error")
         
         response = self.client.get('/api/v1/personal-accounts')
         self.assertEqual(response.status_code, 502)
@@ -191,6 +544,18 @@ class TestFlaskAPI(unittest.TestCase):
         self.assertIn('error', data)
         self.assertEqual(data['error'], 'External API request failed')
     
+    @patch('app.OpenBankingClient._make_request_raw')
+    def test_unexpected_error_handling(self, mock_make_request_raw):
+        """Test unexpected errors return a JSON 500 response."""
+        mock_make_request_raw.side_effect = RuntimeError("boom")
+        self.app.config['TESTING'] = False
+        
+        response = self.client.get('/api/v1/personal-loans')
+        self.assertEqual(response.status_code, 500)
+        
+        data = json.loads(response.data)
+        self.assertEqual(data['error'], 'Internal server error')
+    
     def test_all_api_endpoints(self):
         """Test all API endpoints exist and return proper structure."""
         endpoints = [
@@ -241,6 +606,168 @@ class TestIntegration(unittest.TestCase):
             self.skipTest("Mock API not available")
 
 
+class TestAPITester(unittest.TestCase):
+    """Test cases for the live API check script."""
+    
+    def setUp(self):
+        """Run in a scratch directory so the on-disk cache starts empty."""
+        cwd = os.getcwd()
+        scratch = tempfile.TemporaryDirectory()
+        os.chdir(scratch.name)
+        self.addCleanup(scratch.cleanup)
+        self.addCleanup(os.chdir, cwd)
+        
+        quiet = patch('builtins.print')
+        quiet.start()
+        self.addCleanup(quiet.stop)
+    
+    @unittest.skipIf(test_connection.requests_cache is None, "requests-cache not installed")
+    def test_mock_api_check_never_cached(self):
+        """Test the mock API check fails once the server is down."""
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        mock_api_url = f"http://127.0.0.1:{server.server_port}/v2"
+        
+        self.assertTrue(APITester(mock_api_url=mock_api_url).test_mock_api_connection())
+        server.shutdown()
+        server.server_close()
+        
+        self.assertFalse(APITester(mock_api_url=mock_api_url).test_mock_api_connection())
+    
+    def _streamed_tester(self, status_code, chunks):
+        """Build a tester whose session returns one streamed response."""
+        tester = APITester()
+        response = Mock(status_code=status_code, ok=status_code < 400)
+        response.iter_content.return_value = iter(chunks)
+        tester.session = Mock()
+        tester.session.get.return_value = response
+        return tester, response
+    
+    def test_all_endpoints_batched(self):
+        """Test the batched check maps each result to its endpoint."""
+        page = {"data": [], "links": {}, "meta": {}}
+        results = [{"status": "ok", "data": page}] * len(test_connection.ENDPOINTS)
+        results[1] = {"status": "error", "message": "External API request failed"}
+        tester = APITester()
+        
+        with patch.object(tester, '_probe', return_value=(True, results, 200)) as probe:
+            outcome = tester.test_all_endpoints_batched()
+        
+        self.assertEqual(list(outcome), list(test_connection.ENDPOINTS))
+        self.assertEqual(sum(outcome.values()), len(test_connection.ENDPOINTS) - 1)
+        self.assertFalse(outcome[test_connection.ENDPOINTS[1]])
+        self.assertEqual(probe.call_args.kwargs['method'], 'POST')
+    
+    def test_all_endpoints_batched_short_response(self):
+        """Test a short batch response fails every endpoint."""
+        page = {"data": [], "links": {}, "meta": {}}
+        tester = APITester()
+        
+        for data in ([], [{"status": "ok", "data": page}]):
+            with self.subTest(results=len(data)):
+                with patch.object(tester, '_probe', return_value=(True, data, 200)):
+                    outcome = tester.test_all_endpoints_batched()
+                self.assertEqual(len(outcome), len(test_connection.ENDPOINTS))
+                self.assertFalse(any(outcome.values()))
+    
+    def test_all_endpoints_batched_malformed_entries(self):
+        """Test malformed batch entries fail their endpoint without crashing."""
+        page = {"data": [], "links": {}, "meta": {}}
+        results = [{"status": "ok", "data": page}] * len(test_connection.ENDPOINTS)
+        results[0] = "not an object"
+        results[1] = {"status": "ok"}
+        results[2] = {"status": "ok", "data": [{"id": 1}]}
+        tester = APITester()
+        
+        with patch.object(tester, '_probe', return_value=(True, results, 200)):
+            outcome = tester.test_all_endpoints_batched()
+        
+        self.assertEqual(
+            [outcome[endpoint] for endpoint in test_connection.ENDPOINTS[:4]],
+            [False, False, False, True]
+        )
+    
+    @patch.object(test_connection, 'ijson', None)
+    def test_endpoint_array_body_without_ijson(self):
+        """Test a JSON array body is reported as missing every key."""
+        tester = APITester()
+        tester.session = Mock()
+        tester.session.request.return_value = Mock(
+            status_code=200,
+            headers={'Content-Type': 'application/json'}
+        )
+        tester.session.request.return_value.json.return_value = [{"id": 1}]
+        
+        self.assertFalse(tester.test_endpoint('personal-accounts'))
+        self.assertEqual(
+            APITester._missing_keys([{"id": 1}], tester._default_expected),
+            ['data', 'links', 'meta']
+        )
+    
+    @unittest.skipIf(test_connection.ijson is None, "ijson not installed")
+    def test_top_level_keys_all_present(self):
+        """Test streamed key check finds every key and drains the body."""
+        chunks = [b'{"data": {"items": [1, 2]}, ', b'"links": {}, "meta": {}}', b' ']
+        tester, response = self._streamed_tester(200, chunks)
+        
+        status, keys = tester._get_top_level_keys(
+            'http://api/x', None, 10, tester._default_expected
+        )
+        
+        self.assertEqual(status, 200)
+        self.assertEqual(set(keys), {'data', 'links', 'meta'})
+        self.assertTrue(tester.session.get.call_args.kwargs['stream'])
+        self.assertEqual(list(response.iter_content.return_value), [])
+        response.close.assert_called_once()
+    
+    @unittest.skipIf(test_connection.ijson is None, "ijson not installed")
+    def test_top_level_keys_missing_key(self):
+        """Test streamed key check reports a missing key."""
+        tester, _ = self._streamed_tester(200, [b'{"data": [], "links": {}}'])
+        
+        status, keys = tester._get_top_level_keys(
+            'http://api/x', None, 10, tester._default_expected
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(set(keys), {'data', 'links'})
+        
+        tester, _ = self._streamed_tester(200, [b'{"data": [], "links": {}}'])
+        self.assertFalse(tester.test_endpoint('personal-accounts'))
+    
+    @unittest.skipIf(test_connection.ijson is None, "ijson not installed")
+    def test_top_level_keys_error_status(self):
+        """Test streamed key check skips the body of a non-2xx response."""
+        tester, response = self._streamed_tester(502, [b'<html>'])
+        
+        status, keys = tester._get_top_level_keys(
+            'http://api/x', None, 10, tester._default_expected
+        )
+        
+        self.assertEqual(status, 502)
+        self.assertIsNone(keys)
+        response.close.assert_called_once()
+    
+    @unittest.skipIf(test_connection.ijson is None, "ijson not installed")
+    def test_top_level_keys_malformed_json(self):
+        """Test malformed JSON surfaces as InvalidJSONError."""
+        tester, response = self._streamed_tester(200, [b'{"data": [1, 2', b'}}}'])
+        
+        with self.assertRaises(requests.exceptions.InvalidJSONError):
+            tester._get_top_level_keys(
+                'http://api/x', None, 10, tester._default_expected
+            )
+        response.close.assert_called_once()
+
+
 if __name__ == '__main__':
     # Run tests with verbose output
     unittest.main(verbosity=2)
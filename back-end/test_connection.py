@@ -4,157 +4,372 @@ OpenBanking API Client Test Script
 
 This script tests the connection to the mock API and validates
 that all endpoints are working correctly.
+
+Probes run concurrently over pooled keep-alive HTTP/1.1 connections.
+HTTP/2 multiplexing is not used: the Flask app (Werkzeug or gunicorn)
+and the mock API only serve HTTP/1.1, so an HTTP/2 client would fall
+back to it anyway.
 """
 
 import requests
 import json
 import sys
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import AbstractSet, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+try:
+    import requests_cache
+except ImportError:  # optional: replay responses across runs when installed
+    requests_cache = None
+
+try:
+    import ijson
+except ImportError:  # optional: check response structure without a full parse
+    ijson = None
+
+ENDPOINTS = (
+    'personal-accounts',
+    'business-accounts',
+    'personal-loans',
+    'business-loans',
+    'personal-credit-cards',
+    'business-credit-cards',
+    'personal-financings',
+    'business-financings',
+    'personal-invoice-financings',
+    'business-invoice-financings',
+    'personal-unarranged-account-overdraft',
+    'business-unarranged-account-overdraft'
+)
 
 
 class APITester:
     """Test class for validating API endpoints."""
     
-    def __init__(self, base_url: str = "http://localhost:5000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:5000",
+        mock_api_url: str = "http://localhost:7004/open-banking/products-services/v2"
+    ):
         self.base_url = base_url
-        self.mock_api_url = "http://localhost:7004/open-banking/products-services/v2"
-        self.session = requests.Session()
+        self.mock_api_url = mock_api_url
+        self._api_prefix = f"{base_url}/api/v1/"
+        self._default_expected = frozenset(('data', 'links', 'meta'))
+        if requests_cache is not None:
+            # Replays responses from a local SQLite cache across suite runs,
+            # honoring upstream Cache-Control headers; 404s are cached too.
+            # Liveness checks (the health check and every mock API request)
+            # must always reach the live server.
+            self.session = requests_cache.CachedSession(
+                '.apitester_cache',
+                backend='sqlite',
+                expire_after=300,
+                urls_expire_after={
+                    '*/health': requests_cache.DO_NOT_CACHE,
+                    f"{urlsplit(mock_api_url).netloc}/*": requests_cache.DO_NOT_CACHE
+                },
+                cache_control=True,
+                allowable_codes=(200, 404)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        # Enough pooled connections for every endpoint probe to run at once;
+        # transient gateway errors on GET (and the HEAD liveness probes) are
+        # retried on the same keep-alive pool and the final response is
+        # returned rather than raised
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD']),
+                raise_on_status=False
+            ),
+            pool_connections=16,
+            pool_maxsize=16
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._print_lock = threading.Lock()
+        # Shared by every concurrent probe in a suite run
+        self._executor = ThreadPoolExecutor(max_workers=16)
     
-    def test_mock_api_connection(self) -> bool:
-        """Test if the mock API is running."""
+    def clear_cache(self) -> None:
+        """Clear the on-disk HTTP cache."""
+        if requests_cache is not None:
+            self.session.cache.clear()
+    
+    def _get_top_level_keys(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        timeout: int,
+        expected_keys: AbstractSet[str]
+    ) -> Tuple[int, Optional[Dict[str, None]]]:
+        """
+        GET ``url`` and stream its JSON body through ijson, collecting
+        top-level keys only until every one of ``expected_keys`` is seen.
+        The rest of the body is still read (not parsed) so the keep-alive
+        connection goes back to the pool.
+        
+        Returns the status and the keys seen as a dict with ``None`` values
+        (``None`` for a non-2xx response).
+        """
+        seen = None
+        response = self.session.get(url, params=params, timeout=timeout, stream=True)
         try:
-            # Try to connect to one of the mock API endpoints
-            response = self.session.get(
-                f"{self.mock_api_url}/personal-accounts",
-                timeout=5
-            )
-            print(f"Mock API is running (Status: {response.status_code})")
-            return True
+            if response.ok:
+                seen = {}
+                events = ijson.sendable_list()
+                parser = ijson.parse_coro(events)
+                for chunk in response.iter_content(chunk_size=8192):
+                    if expected_keys.issubset(seen):
+                        continue
+                    parser.send(chunk)
+                    seen.update(
+                        (value, None) for prefix, event, value in events
+                        if prefix == '' and event == 'map_key'
+                    )
+                    del events[:]
+        except ijson.JSONError as e:
+            raise requests.exceptions.InvalidJSONError(str(e), response=response)
+        finally:
+            response.close()
+        
+        return response.status_code, seen
+    
+    @staticmethod
+    def _missing_keys(data: Any, expected_keys: AbstractSet[str]) -> List[str]:
+        """Sorted ``expected_keys`` absent from ``data`` (all, unless it is an object)."""
+        if isinstance(data, dict):
+            return sorted(expected_keys.difference(data.keys()))
+        return sorted(expected_keys)
+    
+    def _print(self, message: str) -> None:
+        """Print a line without interleaving output from worker threads."""
+        with self._print_lock:
+            print(message)
+    
+    def _probe(
+        self,
+        url: str,
+        *,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        expect_status: Union[int, Tuple[int, ...], None] = 200,
+        expected_keys: Optional[AbstractSet[str]] = None,
+        timeout: int = 10
+    ) -> Tuple[bool, Any, Optional[int]]:
+        """
+        Request ``url`` (with ``body`` sent as JSON) and check the response.
+        
+        Returns ``(ok, data, status)``: ``data`` is the decoded JSON body of a
+        response with an expected status (any status if ``expect_status`` is
+        None); HEAD responses carry no body, so their ``data`` is always None.
+        When ``expected_keys`` are given and ijson is installed, the body is
+        streamed and ``data`` only holds its top-level keys.
+        If the request itself failed, ``status`` is None and ``data`` is
+        ``{'error': message}``.
+        """
+        if isinstance(expect_status, int):
+            expect_status = (expect_status,)
+        try:
+            if method == 'GET' and expected_keys and ijson is not None:
+                status, data = self._get_top_level_keys(
+                    url, params, timeout, expected_keys
+                )
+                ok = expect_status is None or status in expect_status
+            else:
+                response = self.session.request(
+                    method, url, params=params, json=body, timeout=timeout
+                )
+                status = response.status_code
+                ok = expect_status is None or status in expect_status
+                data = None
+                if (ok and method != 'HEAD'
+                        and 'json' in response.headers.get('Content-Type', '')):
+                    data = response.json()
         except requests.exceptions.RequestException as e:
-            print(f"Mock API is not running: {str(e)}")
+            return False, {'error': str(e)}, None
+        
+        if ok and expected_keys:
+            ok = not self._missing_keys(data, expected_keys)
+        return ok, data, status
+    
+    def test_mock_api_connection(self) -> bool:
+        """Test if the mock API is running."""
+        # Any response at all, whatever its status, means the mock API is up,
+        # so only the headers are requested
+        ok, data, status = self._probe(
+            f"{self.mock_api_url}/personal-accounts",
+            method='HEAD',
+            expect_status=None,
+            timeout=5
+        )
+        if ok:
+            print(f"Mock API is running (Status: {status})")
+        else:
+            print(f"Mock API is not running: {data['error']}")
             print("Please start the mock API with: cd mock-api && docker-compose up")
-            return False
+        return ok
     
     def test_flask_api_connection(self) -> bool:
         """Test if the Flask API is running."""
-        try:
-            response = self.session.get(f"{self.base_url}/health", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                print(f"Flask API is running: {data.get('service', 'unknown')}")
-                return True
-            else:
-                print(f"Flask API returned status: {response.status_code}")
-                return False
-        except requests.exceptions.RequestException as e:
-            print(f"Flask API is not running: {str(e)}")
+        ok, data, status = self._probe(
+            f"{self.base_url}/health",
+            method='HEAD',
+            timeout=5
+        )
+        if ok:
+            print(f"Flask API is running (Status: {status})")
+        elif status is None:
+            print(f"Flask API is not running: {data['error']}")
             print("Please start the Flask API with: python app.py")
-            return False
+        else:
+            print(f"Flask API returned status: {status}")
+        return ok
     
     def test_endpoint(self, endpoint: str, expected_keys: List[str] = None) -> bool:
         """Test a specific API endpoint."""
         if expected_keys is None:
-            expected_keys = ['data', 'links', 'meta']
+            expected_keys = self._default_expected
+        else:
+            expected_keys = frozenset(expected_keys)
         
-        try:
-            url = f"{self.base_url}/api/v1/{endpoint}"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check if response has expected structure
-                missing_keys = [key for key in expected_keys if key not in data]
-                if missing_keys:
-                    print(f"{endpoint}: Missing keys {missing_keys}")
-                    return False
-                
-                print(f"{endpoint}: OK")
-                return True
-                
-            elif response.status_code == 502:
-                print(f"{endpoint}: External API unavailable (502)")
-                return False
-                
-            else:
-                print(f"{endpoint}: HTTP {response.status_code}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            print(f"{endpoint}: {str(e)}")
-            return False
+        ok, data, status = self._probe(
+            self._api_prefix + endpoint,
+            expected_keys=expected_keys
+        )
+        if ok:
+            self._print(f"{endpoint}: OK")
+        elif status is None:
+            self._print(f"{endpoint}: {data['error']}")
+        elif status != 200:
+            self._print(f"{endpoint}: HTTP {status}")
+        else:
+            # Check if response has expected structure
+            missing_keys = self._missing_keys(data, expected_keys)
+            self._print(f"{endpoint}: Missing keys {missing_keys}")
+        return ok
     
     def test_all_endpoints(self) -> Dict[str, bool]:
         """Test all available endpoints."""
-        endpoints = [
-            'personal-accounts',
-            'business-accounts',
-            'personal-loans',
-            'business-loans',
-            'personal-credit-cards',
-            'business-credit-cards',
-            'personal-financings',
-            'business-financings',
-            'personal-invoice-financings',
-            'business-invoice-financings',
-            'personal-unarranged-account-overdraft',
-            'business-unarranged-account-overdraft'
-        ]
+        self._print("\nTesting all endpoints...")
+        self._print("-" * 50)
         
+        # Endpoints are independent, so probe them concurrently
         results = {}
-        print("\nTesting all endpoints...")
-        print("-" * 50)
+        futures = {
+            self._executor.submit(self.test_endpoint, endpoint): endpoint
+            for endpoint in ENDPOINTS
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        
+        return {endpoint: results[endpoint] for endpoint in ENDPOINTS}
+    
+    def test_all_endpoints_batched(self) -> Dict[str, bool]:
+        """Test all available endpoints with a single batch request."""
+        self._print("\nTesting all endpoints (batched)...")
+        self._print("-" * 50)
+        
+        ok, data, status = self._probe(
+            self._api_prefix + 'batch',
+            method='POST',
+            body={'requests': [{'endpoint': endpoint} for endpoint in ENDPOINTS]},
+            timeout=30
+        )
+        if not ok or not isinstance(data, list):
+            # Older servers have no batch route; probe endpoints one by one
+            reason = data['error'] if status is None else f"HTTP {status}"
+            self._print(f"Batch request failed ({reason}), falling back to individual requests")
+            return self.test_all_endpoints()
         
-        for endpoint in endpoints:
-            results[endpoint] = self.test_endpoint(endpoint)
+        # One result per sub-request is expected; anything else can't be
+        # matched to endpoints and fails them all rather than shrinking
+        # the total
+        if len(data) != len(ENDPOINTS):
+            self._print(
+                f"Batch returned {len(data)} results for {len(ENDPOINTS)} endpoints"
+            )
+            return {endpoint: False for endpoint in ENDPOINTS}
+        
+        results = {}
+        for endpoint, entry in zip(ENDPOINTS, data):
+            if not isinstance(entry, dict):
+                self._print(f"{endpoint}: Malformed batch result {entry!r}")
+                results[endpoint] = False
+                continue
+            if entry.get('status') != 'ok':
+                self._print(f"{endpoint}: {entry.get('message', 'request failed')}")
+                results[endpoint] = False
+                continue
+            
+            # Check if response has expected structure
+            missing_keys = self._missing_keys(entry.get('data'), self._default_expected)
+            if missing_keys:
+                self._print(f"{endpoint}: Missing keys {missing_keys}")
+            else:
+                self._print(f"{endpoint}: OK")
+            results[endpoint] = not missing_keys
         
         return results
     
+    def _check_pagination(self) -> Tuple[bool, str]:
+        """Check pagination parameters are accepted; returns (ok, message)."""
+        ok, data, status = self._probe(
+            self._api_prefix + 'personal-accounts',
+            params={'page': 1, 'page-size': 10},
+            expect_status=(200, 502)  # 502 if mock API unavailable
+        )
+        if ok:
+            return ok, "Pagination: Parameters accepted"
+        if status is None:
+            return ok, f"Pagination: {data['error']}"
+        return ok, f"Pagination: HTTP {status}"
+    
+    def _check_error_handling(self) -> Tuple[bool, str]:
+        """Check invalid endpoints return 404; returns (ok, message)."""
+        ok, data, status = self._probe(
+            self._api_prefix + 'nonexistent',
+            method='HEAD',
+            expect_status=404
+        )
+        if ok:
+            return ok, "Error handling: 404 for invalid endpoint"
+        if status is None:
+            return ok, f"Error handling: {data['error']}"
+        return ok, f"Error handling: Expected 404, got {status}"
+    
     def test_pagination(self) -> bool:
         """Test pagination functionality."""
-        try:
-            url = f"{self.base_url}/api/v1/personal-accounts"
-            params = {'page': 1, 'page-size': 10}
-            
-            response = self.session.get(url, params=params, timeout=10)
-            
-            if response.status_code in [200, 502]:  # 502 if mock API unavailable
-                print("Pagination: Parameters accepted")
-                return True
-            else:
-                print(f"Pagination: HTTP {response.status_code}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Pagination: {str(e)}")
-            return False
+        ok, message = self._check_pagination()
+        self._print(message)
+        return ok
     
     def test_error_handling(self) -> bool:
         """Test error handling for invalid endpoints."""
-        try:
-            response = self.session.get(f"{self.base_url}/api/v1/nonexistent")
-            
-            if response.status_code == 404:
-                print("Error handling: 404 for invalid endpoint")
-                return True
-            else:
-                print(f"Error handling: Expected 404, got {response.status_code}")
-                return False
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Error handling: {str(e)}")
-            return False
+        ok, message = self._check_error_handling()
+        self._print(message)
+        return ok
     
-    def run_full_test_suite(self) -> None:
+    def run_full_test_suite(self, batch: bool = False) -> None:
         """Run the complete test suite."""
         print("OpenBanking API Client Test Suite")
         print("=" * 50)
         
-        # Test connections
+        # Test connections. These also warm the pool: the mock API check
+        # opens a keep-alive connection to the mock host and the health
+        # check one to the Flask API, so the fanout below starts warm
         print("\n🔗 Testing Connections...")
         mock_api_ok = self.test_mock_api_connection()
         flask_api_ok = self.test_flask_api_connection()
@@ -163,16 +378,25 @@ class APITester:
             print("\nCannot continue tests - Flask API not running")
             sys.exit(1)
         
-        # Test endpoints
-        endpoint_results = self.test_all_endpoints()
+        # Pagination and error handling don't depend on the endpoint probes,
+        # so all of them run in one concurrent flight; their results are
+        # printed once the endpoint block is done
+        pagination_future = self._executor.submit(self._check_pagination)
+        error_handling_future = self._executor.submit(self._check_error_handling)
+        if batch:
+            endpoint_results = self.test_all_endpoints_batched()
+        else:
+            endpoint_results = self.test_all_endpoints()
         
         # Test pagination
         print("\nTesting Pagination...")
-        pagination_ok = self.test_pagination()
+        pagination_ok, message = pagination_future.result()
+        print(message)
         
         # Test error handling
         print("\nTesting Error Handling...")
-        error_handling_ok = self.test_error_handling()
+        error_handling_ok, message = error_handling_future.result()
+        print(message)
         
         # Summary
         print("\nTest Summary")
@@ -214,10 +438,22 @@ def main():
         '--endpoint',
         help='Test a specific endpoint only'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Clear cached responses before running'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Check all endpoints with one request to the batch route'
+    )
     
     args = parser.parse_args()
     
     tester = APITester(args.url)
+    if args.no_cache:
+        tester.clear_cache()
     
     if args.endpoint:
         # Test specific endpoint
@@ -226,7 +462,7 @@ def main():
         sys.exit(0 if success else 1)
     else:
         # Run full test suite
-        tester.run_full_test_suite()
+        tester.run_full_test_suite(batch=args.batch)
 
 
 if __name__ == '__main__':
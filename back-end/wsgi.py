@@ -0,0 +1,19 @@
+"""
+WSGI entry point for the OpenBanking Services API Client
+
+Production deployments run the app under gunicorn with gevent workers so
+handlers yield while waiting on the upstream API instead of pinning a
+worker per request:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 --timeout 60 wsgi:application
+"""
+
+# Must run before anything imports socket/ssl so requests cooperates with gevent
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import create_app  # noqa: E402
+
+
+application = create_app()